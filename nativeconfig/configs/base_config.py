@@ -5,8 +5,10 @@ import contextlib
 import inspect
 import json
 import logging
+import os
+import stat
+import tempfile
 import threading
-import traceback
 from warnings import warn
 
 from nativeconfig.options.base_option import BaseOption
@@ -15,6 +17,46 @@ from nativeconfig.options import StringOption
 
 LOG = logging.getLogger('nativeconfig')
 
+_MISS = object()  # Sentinel for values that are not in cache. None is a valid cached value.
+
+
+def _atomic_write(path, data, *, fsync=True):
+    """
+    Replace content of the file with data in a single atomic step.
+
+    Data is written to a uniquely named temporary file next to the target which is then renamed over it.
+    Symlinks are resolved so that the file they point to is replaced. Permissions of an existing file are preserved.
+    If the file doesn't exist, it's created with mkstemp's 0600 permissions rather than the ones allowed by umask.
+
+    @param path: Path to the file.
+    @type path: str or Path
+
+    @param data: New content of the file.
+    @type data: bytes
+
+    @param fsync: Whether data must be flushed to disk before the file is replaced.
+    @type fsync: bool
+    """
+    path = os.path.realpath(str(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=os.path.dirname(path))
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+
+        os.replace(tmp_path, path)
+    except:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
 
 class _OrderedClass(ABCMeta):
     """
@@ -26,18 +68,10 @@ class _OrderedClass(ABCMeta):
 
     def __new__(cls, name, bases, classdict, **kwargs):
         result = type.__new__(cls, name, bases, dict(classdict), **kwargs)
-        result._ordered_options = []
-
-        def add_option(base_class, option):
-            for i, o in enumerate(result._ordered_options):
-                if o.name == option.name:
-                    if not issubclass(option.__class__, o.__class__):
-                        warn("Type (\"{}\") of the \"{}\" option overridden by \"{}\" is different than type (\"{}\") defined by one of super classes.".format(option.__class__.__name__, option.name, base_class.__name__, o.__class__.__name__))
-                    result._ordered_options.pop(i)
-                    break
-            result._ordered_options.append(option)
-
-        # Get ordered options from base class.
+
+        # First pass: collect (defining class, option) pairs from base classes and then from the class itself.
+        pairs = []
+
         mro = inspect.getmro(result)
         if len(mro) > 1:
             for base_class in reversed(mro[1:]):
@@ -47,12 +81,26 @@ class _OrderedClass(ABCMeta):
                 else:  # e.g. mixin
                     options = [o for k, o in base_class.__dict__.items() if isinstance(o, BaseOption)]
 
-                for o in options:
-                    add_option(base_class, o)
+                pairs.extend((base_class, o) for o in options)
+
+        pairs.extend((result, v) for k, v in classdict.items() if inspect.isdatadescriptor(v) and isinstance(v, BaseOption))
+
+        # Second pass: warn about type changes and keep the last definition of each option in order of definition.
+        last_by_name = {}
+        for base_class, o in pairs:
+            previous = last_by_name.get(o.name)
+            if previous is not None and not issubclass(o.__class__, previous.__class__):
+                warn("Type (\"{}\") of the \"{}\" option overridden by \"{}\" is different than type (\"{}\") defined by one of super classes.".format(o.__class__.__name__, o.name, base_class.__name__, previous.__class__.__name__))
+            last_by_name[o.name] = o
+
+        ordered_options = []
+        for base_class, o in reversed(pairs):
+            if last_by_name.pop(o.name, None) is not None:
+                ordered_options.append(o)
 
-        new_options = [v for k, v in classdict.items() if inspect.isdatadescriptor(v) and isinstance(v, BaseOption)]
-        for o in new_options:
-            add_option(result, o)
+        ordered_options.reverse()
+        result._ordered_options = ordered_options
+        result._ordered_option_names = tuple(o.name for o in ordered_options)
 
         return result
 
@@ -71,6 +119,7 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
     @cvar CONFIG_VERSION_OPTION_NAME: Name of the option that represents config version in backend.
 
     @ivar _ordered_options: Ordered dict of options defined in the order of definition from base class to subclasses.
+    @ivar _ordered_option_names: Tuple of names of _ordered_options in the same order.
     """
     ALLOW_CACHE = False
     CONFIG_VERSION = '1.0'
@@ -125,10 +174,13 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
                     properties.add(attribute_value.name)
 
     def __init__(self):
+        self._batch_conf = None
+
         self.validate()
         super().__init__()
 
-        self._lock = threading.Lock()
+        # Reentrant so that batch and the locking accessors can be used while the config is entered as a context.
+        self._lock = threading.RLock()
         self._cache = self.make_cache()
 
         self.migrate(self.config_version)
@@ -425,8 +477,8 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
         """
         Generator to enumerate option names.
         """
-        for o in self._ordered_options:
-            yield o.name
+        for n in self._ordered_option_names:
+            yield n
 
     def python_items(self):
         """
@@ -527,8 +579,7 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @return: Value to be used based on Raw Value.
         """
-        LOG.error("Unable to deserialize value of \"%s\" from \"%s\":\n%s.", name, raw_or_json_value,
-                  traceback.format_exception(*exc_info))
+        LOG.error("Unable to deserialize value of \"%s\" from \"%s\":", name, raw_or_json_value, exc_info=exc_info)
         return self.option_for_name(name)._default
 
     def migrate(self, version):
@@ -582,6 +633,57 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
         """
         return {}
 
+    #{ Batching
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Group multiple accesses to the backend within the context.
+
+        Backend is read once on enter via _read_backend and written once on exit via _write_backend.
+        Within the context subclasses access the in-memory copy stored in _batch_conf.
+        Nested contexts are merged into the outermost one.
+
+        The in-memory copy is shared by all threads: if another thread's batch is open, the context joins it
+        and changes are written when that batch exits. Accesses from other threads outside of batch
+        see the in-memory copy as well.
+
+        Default implementation does nothing, because _read_backend returns None.
+        """
+        with self._lock:
+            is_outermost = self._batch_conf is None
+
+            if is_outermost:
+                self._batch_conf = self._read_backend()
+
+        if not is_outermost:
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            # Writers wait for the flush, otherwise they could read the backend before it and be overwritten.
+            with self._lock:
+                conf, self._batch_conf = self._batch_conf, None
+
+                if conf is not None:
+                    self._write_backend(conf)
+
+    def _read_backend(self):
+        """
+        Read the whole backend into memory for batch. Errors must be handled by the implementation.
+
+        @return: Mutable copy of the backend or None if batching is not supported or the backend is not accessible.
+        """
+        return None
+
+    def _write_backend(self, conf):
+        """
+        Write in-memory copy made by _read_backend back to the backend. Errors must be handled by the implementation.
+        """
+        pass
+
     #{ Backend access
 
     def get_value(self, name, *, allow_cache=False):
@@ -700,12 +802,14 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @see: get_value
         """
-        if allow_cache and name in self._cache:
-            return self._cache[name]
-        else:
-            v = self.get_value_cache_free(name)
-            self._cache[name] = v
-            return v
+        if allow_cache:
+            v = self._cache.get(name, _MISS)
+            if v is not _MISS:
+                return v
+
+        v = self.get_value_cache_free(name)
+        self._cache[name] = v
+        return v
 
     def set_value_lock_free(self, name, raw_value, *, allow_cache=False):
         """
@@ -713,7 +817,7 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @see: set_value
         """
-        if not allow_cache or name not in self._cache or self._cache[name] != raw_value:
+        if not allow_cache or self._cache.get(name, _MISS) != raw_value:
             self.set_value_cache_free(name, raw_value)
             self._cache[name] = raw_value
             LOG.debug("Value of \"%s\" is set to \"%s\".", name, raw_value)
@@ -724,7 +828,7 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @see: del_value
         """
-        if not allow_cache or name not in self._cache or self._cache[name] is not None:
+        if not allow_cache or self._cache.get(name, _MISS) is not None:
             self.del_value_cache_free(name)
             self._cache[name] = None
             LOG.debug("Delete value of \"%s\".", name)
@@ -735,12 +839,14 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @see: get_array_value
         """
-        if allow_cache and name in self._cache:
-            return self._cache[name]
-        else:
-            v = self.get_array_value_cache_free(name)
-            self._cache[name] = v
-            return v
+        if allow_cache:
+            v = self._cache.get(name, _MISS)
+            if v is not _MISS:
+                return v
+
+        v = self.get_array_value_cache_free(name)
+        self._cache[name] = v
+        return v
 
     def set_array_value_lock_free(self, name, value, *, allow_cache=False):
         """
@@ -748,7 +854,7 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @see: set_array_value
         """
-        if not allow_cache or name not in self._cache or self._cache[name] != value:
+        if not allow_cache or self._cache.get(name, _MISS) != value:
             self.set_array_value_cache_free(name, value)
             self._cache[name] = value
             LOG.debug("Array value of \"%s\" is set to \"%s\".", name, value)
@@ -759,12 +865,14 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @see: get_dict_value
         """
-        if allow_cache and name in self._cache:
-            return self._cache[name]
-        else:
-            v = self.get_dict_value_cache_free(name)
-            self._cache[name] = v
-            return v
+        if allow_cache:
+            v = self._cache.get(name, _MISS)
+            if v is not _MISS:
+                return v
+
+        v = self.get_dict_value_cache_free(name)
+        self._cache[name] = v
+        return v
 
     def set_dict_value_lock_free(self, name, value, *, allow_cache=False):
         """
@@ -772,7 +880,7 @@ class BaseConfig(Mapping, metaclass=_OrderedClass):
 
         @see: set_dict_value
         """
-        if not allow_cache or name not in self._cache or self._cache[name] != value:
+        if not allow_cache or self._cache.get(name, _MISS) != value:
             self.set_dict_value_cache_free(name, value)
             self._cache[name] = value
             LOG.debug("Dict value of \"%s\" is set to \"%s\".", name, value)
@@ -2,43 +2,79 @@ from collections import OrderedDict
 import json
 import logging
 from pathlib import Path
+import sys
 
-from nativeconfig.configs.base_config import BaseConfig
+from nativeconfig.configs.base_config import BaseConfig, _atomic_write
+
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+
+def _loads_json_bytes(data):
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(data)
+        except ValueError:
+            # orjson is stricter than json, e.g. it rejects lone surrogates that json.dumps writes as \udXXX escapes.
+            pass
+
+    return json.loads(data.decode('utf-8'))
 
 
 LOG = logging.getLogger('nativeconfig')
 
+# Plain dict preserves insertion order since Python 3.7 and is lighter than OrderedDict.
+_OrderedDict = dict if sys.version_info >= (3, 7) else OrderedDict
+
 
 class JSONConfig(BaseConfig):
     """
     Store config in a JSON file as a dictionary. Fields are written in order of definition.
 
+    If orjson is available, it's used to parse the file. Files it rejects are parsed with json.
+
     @cvar JSON_PATH: Path to the config file.
+    @cvar FSYNC: Whether writes must be flushed to disk before the config file is replaced.
     """
     LOG = LOG.getChild('JSONConfig')
 
     JSON_PATH = None
+    FSYNC = True
 
     def __init__(self):
-        if not Path(self.JSON_PATH).is_file():
-            with open(self.JSON_PATH, 'w+', encoding='utf-8') as f:
+        self._json_path = Path(self.JSON_PATH)
+
+        if not self._json_path.is_file():
+            with self._json_path.open('w+', encoding='utf-8') as f:
                 f.write(json.dumps({}))
 
         super().__init__()
 
     #{ Private
 
+    def _read_json(self):
+        with self._json_path.open('rb') as f:
+            return _loads_json_bytes(f.read())
+
+    def _write_json(self, conf):
+        ordered_conf = _OrderedDict((n, conf[n]) for n in self._ordered_option_names if n in conf)
+        _atomic_write(self._json_path, json.dumps(ordered_conf, indent=4).encode('utf-8'), fsync=self.FSYNC)
+
     def _get_json_value(self, key):
         try:
-            with open(self.JSON_PATH, 'r', encoding='utf-8') as f:
-                try:
-                    conf = json.load(f)
-                    if key in conf:
-                        return conf[key]
-                    else:
-                        self.LOG.info("Config file doesn't contain the key \"%s\".", key)
-                except ValueError:
-                    self.LOG.exception("Config file isn't valid:")
+            conf = self._batch_conf
+
+            if conf is None:
+                conf = self._read_json()
+
+            if key in conf:
+                return conf[key]
+            else:
+                self.LOG.info("Config file doesn't contain the key \"%s\".", key)
+        except ValueError:
+            self.LOG.exception("Config file isn't valid:")
         except:
             self.LOG.exception("Unable to access config file:")
 
@@ -46,22 +82,16 @@ class JSONConfig(BaseConfig):
 
     def _set_json_value(self, key, raw_value):
         try:
-            with open(self.JSON_PATH, 'r+', encoding='utf-8') as f:
-                conf = json.load(f)
-
-                if raw_value is None:
-                    conf.pop(key, None)
-                else:
-                    conf[key] = raw_value
-
-                ordered_conf = OrderedDict()
-                for m in self.options():
-                    if m.name in conf:
-                        ordered_conf[m.name] = conf.pop(m.name)
-
-                f.seek(0)
-                json.dump(ordered_conf, f, indent=4)
-                f.truncate()
+            batch_conf = self._batch_conf
+            conf = batch_conf if batch_conf is not None else self._read_json()
+
+            if raw_value is None:
+                conf.pop(key, None)
+            else:
+                conf[key] = raw_value
+
+            if batch_conf is None:
+                self._write_json(conf)
         except:
             self.LOG.exception("Unable to access config file:")
 
@@ -69,9 +99,21 @@ class JSONConfig(BaseConfig):
 
     #{ BaseConfig
 
+    def _read_backend(self):
+        try:
+            return self._read_json()
+        except:
+            self.LOG.exception("Unable to access config file:")
+            return None
+
+    def _write_backend(self, conf):
+        try:
+            self._write_json(conf)
+        except:
+            self.LOG.exception("Unable to access config file:")
+
     def make_cache(self):
-        with open(self.JSON_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_json()
 
     def get_value_cache_free(self, name):
         return self._get_json_value(name)
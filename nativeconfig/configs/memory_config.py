@@ -1,24 +1,33 @@
-from copy import deepcopy
-
 from nativeconfig.configs.base_config import BaseConfig
 
 
+def _copy_config(config):
+    """
+    Copy config dict and its array and dict values.
+
+    Raw Values are strings, so there is no need for a deep copy.
+    """
+    return {k: (list(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v) for k, v in config.items()}
+
+
 class MemoryConfig(BaseConfig):
     """
     Store config in in-memory dict.
+
+    Raw Values of array and dict options are copied one level deep, nested mutation is not supported.
     """
     def __init__(self, initial_config=None):
         """
         @param initial_config: Initial state of the memory config.
         @type initial_config: dict or None
         """
-        self._config = deepcopy(initial_config) if initial_config else {}
+        self._config = _copy_config(initial_config) if initial_config else {}
         super().__init__()
 
     #{ BaseConfig
 
     def make_cache(self):
-        return deepcopy(self._config)
+        return _copy_config(self._config)
 
     def get_value_cache_free(self, name):
         return self._config.get(name, None)
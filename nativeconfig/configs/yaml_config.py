@@ -3,52 +3,86 @@ import logging
 from pathlib import Path
 import yaml
 
-from nativeconfig.configs.base_config import BaseConfig
+from nativeconfig.configs.base_config import BaseConfig, _atomic_write
 
 
 LOG = logging.getLogger('nativeconfig')
 
+_ORDERED_DUMPERS = {}
+
+
+def _represent_ordered_dict(dumper, data):
+    return dumper.represent_mapping('tag:yaml.org,2002:map', data.items())
+
+
+def _represent_tuple(dumper, data):
+    return dumper.represent_sequence('tag:yaml.org,2002:seq', data)
+
+
+def _ordered_dumper(dumper):
+    """
+    Return subclass of a given dumper that represents OrderedDict as a regular mapping and tuple as a regular sequence.
+
+    Subclass is created and registered only once per dumper.
+    """
+    try:
+        return _ORDERED_DUMPERS[dumper]
+    except KeyError:
+        d = type('Ordered' + dumper.__name__, (dumper,), {})
+        d.add_representer(OrderedDict, _represent_ordered_dict)
+        d.add_representer(tuple, _represent_tuple)
+        return _ORDERED_DUMPERS.setdefault(dumper, d)
+
 
 class YAMLConfig(BaseConfig):
     """
     Store config in a YAML file as a dictionary. Fields are written in order of definition.
 
     @cvar YAML_PATH: Path to the config file.
+    @cvar YAML_LOADER: Loader used to read the config file. Safe loader by default, since Raw Values are plain strings.
+    @cvar YAML_DUMPER: Dumper used to write the config file.
+    @cvar FSYNC: Whether writes must be flushed to disk before the config file is replaced.
     """
     LOG = LOG.getChild('YAMLConfig')
 
     YAML_PATH = None
-    YAML_LOADER = yaml.CLoader if yaml.__with_libyaml__ else yaml.Loader
+    YAML_LOADER = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
     YAML_DUMPER = yaml.CDumper if yaml.__with_libyaml__ else yaml.Dumper
+    FSYNC = True
 
     def __init__(self):
-        if not Path(self.YAML_PATH).is_file():
-            with open(self.YAML_PATH, 'w+', encoding='utf-8') as f:
-                yaml.dump({}, f, Dumper=self.YAML_DUMPER)
+        self._yaml_path = Path(self.YAML_PATH)
 
-        class OrderedDumper(self.YAML_DUMPER):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, **kwargs)
-                self.add_representer(OrderedDict, lambda dumper, data: dumper.represent_mapping('tag:yaml.org,2002:map',
-                                                                                                data.items()))
-
-        self.YAML_DUMPER = OrderedDumper
+        if not self._yaml_path.is_file():
+            with self._yaml_path.open('w+', encoding='utf-8') as f:
+                yaml.dump({}, f, Dumper=self.YAML_DUMPER)
 
+        self.YAML_DUMPER = _ordered_dumper(self.YAML_DUMPER)
         super().__init__()
 
     #{ Private
 
+    def _read_yaml(self):
+        with self._yaml_path.open('rb') as f:
+            return yaml.load(f.read().decode('utf-8'), Loader=self.YAML_LOADER)
+
+    def _write_yaml(self, conf):
+        ordered_conf = OrderedDict((n, conf[n]) for n in self._ordered_option_names if n in conf)
+        _atomic_write(self._yaml_path, yaml.dump(ordered_conf, Dumper=self.YAML_DUMPER).encode('utf-8'), fsync=self.FSYNC)
+
     def _get_yaml_value(self, key):
         try:
-            with Path(self.YAML_PATH).open('r', encoding='utf-8') as f:
-                try:
-                    conf = yaml.load(f, Loader=self.YAML_LOADER)
-                    if key in conf:
-                        return conf[key]
-                    else:
-                        self.LOG.info("Config file doesn't contain the key \"%s\".", key)
-                except ValueError:
-                    self.LOG.exception("Config file isn't valid:")
+            conf = self._batch_conf
+
+            if conf is None:
+                conf = self._read_yaml()
+
+            if key in conf:
+                return conf[key]
+            else:
+                self.LOG.info("Config file doesn't contain the key \"%s\".", key)
+        except ValueError:
+            self.LOG.exception("Config file isn't valid:")
         except:
             self.LOG.exception("Unable to access config file:")
 
@@ -56,30 +90,36 @@ class YAMLConfig(BaseConfig):
 
     def _set_yaml_value(self, key, raw_value):
         try:
-            with Path(self.YAML_PATH).open('r+', encoding='utf-8') as f:
-                conf = yaml.load(f, Loader=self.YAML_LOADER)
-
-                if raw_value is None:
-                    conf.pop(key, None)
-                else:
-                    conf[key] = raw_value
-
-                ordered_conf = OrderedDict()
-                for m in self.options():
-                    if m.name in conf:
-                        ordered_conf[m.name] = conf.pop(m.name)
-
-                f.seek(0)
-                yaml.dump(ordered_conf, f, Dumper=self.YAML_DUMPER)
-                f.truncate()
+            batch_conf = self._batch_conf
+            conf = batch_conf if batch_conf is not None else self._read_yaml()
+
+            if raw_value is None:
+                conf.pop(key, None)
+            else:
+                conf[key] = raw_value
+
+            if batch_conf is None:
+                self._write_yaml(conf)
         except:
             self.LOG.exception("Unable to access config file:")
 
     #{ BaseConfig
 
+    def _read_backend(self):
+        try:
+            return self._read_yaml()
+        except:
+            self.LOG.exception("Unable to access config file:")
+            return None
+
+    def _write_backend(self, conf):
+        try:
+            self._write_yaml(conf)
+        except:
+            self.LOG.exception("Unable to access config file:")
+
     def make_cache(self):
-        with Path(self.YAML_PATH).open('r', encoding='utf-8') as f:
-            return yaml.load(f, Loader=self.YAML_LOADER)
+        return self._read_yaml()
 
     def get_value_cache_free(self, name):
         return self._get_yaml_value(name)
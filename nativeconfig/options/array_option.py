@@ -1,9 +1,10 @@
-import json
-
 from .base_option import BaseOption, BaseContainerOption
 from nativeconfig.exceptions import DeserializationError, ValidationError
 
 
+_JSON_NULL = 'null'
+
+
 class ArrayOption(BaseContainerOption):
     """
     ArrayOption represents Python arrays in config. ArrayOption can contain other Options as elements
@@ -24,21 +25,17 @@ class ArrayOption(BaseContainerOption):
         super().__init__(name, setter='set_array_value', getter='get_array_value', **kwargs)
 
     def serialize(self, python_value):
-        serializable_list = []
-
-        for i in python_value:
-            serializable_list.append(self._value_option.serialize(i))
-
-        return serializable_list
+        serialize = self._serialize_value
+        return [serialize(i) for i in python_value]
 
     def deserialize(self, raw_value):
-        try:
-            deserialized_list = []
+        if not isinstance(raw_value, (list, tuple)):
+            raise DeserializationError("'{}' is not an array".format(raw_value), raw_value, self.name)
 
-            for i in raw_value:
-                deserialized_list.append(self._value_option.deserialize(i))
+        deserialize = self._deserialize_value
 
-            value = deserialized_list
+        try:
+            value = [deserialize(i) for i in raw_value]
         except DeserializationError:
             raise DeserializationError("unable to deserialize '{}' into array".format(raw_value), raw_value, self.name)
         else:
@@ -48,9 +45,10 @@ class ArrayOption(BaseContainerOption):
         # A JSON array of JSON-serialized values must be constructed manually
         # to avoid double-serialization.
         if python_value is not None:
-            return '[' + ', '.join([self._value_option.serialize_json(v) for v in python_value]) + ']'
+            serialize_json = self._serialize_json_value
+            return '[' + ', '.join([serialize_json(v) for v in python_value]) + ']'
         else:
-            return super().serialize_json(python_value)
+            return _JSON_NULL
 
     def deserialize_json(self, json_value):
         value = super().deserialize_json(json_value)
@@ -59,15 +57,22 @@ class ArrayOption(BaseContainerOption):
             if not isinstance(value, list):
                 raise DeserializationError("'{}' is not a JSON array".format(json_value), json_value, self.name)
             else:
-                return [self._value_option.deserialize_json(json.dumps(v)) for v in value]
+                deserialize_json_value = self._deserialize_json_value
+                return [deserialize_json_value(v) for v in value]
         else:
             return None
 
-    def validate(self, python_value):
-        super().validate(python_value)
+    #{ BaseContainerOption
 
+    def _validate_container_type(self, python_value):
         if not isinstance(python_value, (list, tuple)):
             raise ValidationError("'{}' must be a list or tuple".format(python_value), python_value, self.name)
 
+    def _validate_elements(self, python_value):
+        validate = self._validate_value
         for v in python_value:
-            self._value_option.validate(v)
+            validate(v)
+
+    def _validate_and_serialize_elements(self, python_value):
+        validate_and_serialize = self._validate_and_serialize_value
+        return [validate_and_serialize(v) for v in python_value]
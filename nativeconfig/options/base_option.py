@@ -5,7 +5,7 @@ from enum import Enum
 import json
 import logging
 import os
-import sys
+from pathlib import PurePath
 
 from nativeconfig.exceptions import ValidationError, DeserializationError
 
@@ -13,6 +13,26 @@ from nativeconfig.exceptions import ValidationError, DeserializationError
 LOG = logging.getLogger('nativeconfig')
 
 
+# Choices are hashed into a set only if there are more than that many of them.
+_CHOICES_SET_MIN_LEN = 8
+
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, frozenset, Enum, PurePath)
+
+
+def _copy_value(value):
+    """
+    Deep copy value, returning immutable values as is.
+    """
+    if value is None or isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    elif type(value) is list:
+        return [_copy_value(v) for v in value]
+    elif type(value) is tuple:
+        return tuple([_copy_value(v) for v in value])
+    else:
+        return copy.deepcopy(value)
+
+
 class ValueSource(Enum):
     resolver = 1
     default = 2
@@ -83,9 +103,10 @@ class BaseOption(property, metaclass=ABCMeta):
         self._setter = setter
         self._deleter = deleter
         self._resolver = resolver
-        self._choices = copy.deepcopy(choices) if choices is not None else None
+        self._choices = _copy_value(choices)
+        self._choices_lookup = self._make_choices_lookup(self._choices)
         self._env_name = env_name
-        self._default = copy.deepcopy(default) if default is not None else None
+        self._default = _copy_value(default)
         self._allow_cache = allow_cache
         self.__doc__ = doc or self.__doc__
 
@@ -114,11 +135,27 @@ class BaseOption(property, metaclass=ABCMeta):
 
     @property
     def choices(self):
-        return copy.deepcopy(self._choices)
+        return _copy_value(self._choices)
 
     @property
     def default(self):
-        return copy.deepcopy(self._default)
+        return _copy_value(self._default)
+
+    @staticmethod
+    def _make_choices_lookup(choices):
+        """
+        Make collection used to test membership of choices.
+
+        Long hashable choices are put into a frozenset. Short choices and Enum members are kept as is:
+        scanning them stops at the first identical item, which is faster than hashing.
+        """
+        try:
+            if choices is None or len(choices) <= _CHOICES_SET_MIN_LEN or any(isinstance(c, Enum) for c in choices):
+                return choices
+
+            return frozenset(choices)
+        except TypeError:
+            return choices
 
     def set_one_shot_value(self, python_value):
         """
@@ -144,9 +181,27 @@ class BaseOption(property, metaclass=ABCMeta):
         if python_value is None:
             raise ValidationError("None is never valid and must not reach this method", python_value, self.name)
 
-        if self._choices is not None and python_value not in self._choices:
+        try:
+            if self._choices_lookup is not None and python_value not in self._choices_lookup:
+                raise ValidationError("'{}' must be in {}".format(python_value, self._choices), python_value, self.name)
+        except TypeError:
+            # Unhashable value is not in the frozenset of hashable choices.
             raise ValidationError("'{}' must be in {}".format(python_value, self._choices), python_value, self.name)
 
+    def validate_and_serialize(self, python_value):
+        """
+        Validate Python Value and serialize it into Raw Value.
+
+        Container options override it to validate and serialize elements in a single pass.
+
+        @see: validate, serialize
+
+        @raise ValidationError: Raise if value is wrong.
+        @raise SerializationError: Raise if value cannot be serialized.
+        """
+        self.validate(python_value)
+        return self.serialize(python_value)
+
     #{ Serialization and deserialization
 
     def serialize(self, python_value):
@@ -190,15 +245,73 @@ class BaseOption(property, metaclass=ABCMeta):
         @see: serialize_json
         """
         try:
-            return json.loads(json_value)
+            value = json.loads(json_value)
         except ValueError:
             raise DeserializationError("'{}' is invalid JSON".format(json_value), json_value, self.name)
+        else:
+            return self._deserialize_decoded_json(value, json_value)
+
+    def deserialize_json_value(self, value):
+        """
+        Deserialize Python object decoded from JSON Value into Python Value.
+
+        Used by container options to deserialize their elements without encoding them back into JSON.
+
+        @see: deserialize_json
+        """
+        return self._deserialize_decoded_json(value, None)
+
+    def _deserialize_decoded_json(self, value, json_value):
+        """
+        Deserialize Python object decoded from JSON Value into Python Value.
+
+        Default implementation returns value as is if it was decoded by deserialize_json.
+        Otherwise value is round-tripped through deserialize_json for options that only override it.
+
+        @param json_value: JSON Value the value was decoded from or None if called by deserialize_json_value.
+        """
+        if json_value is not None:
+            return value
+        else:
+            return self.deserialize_json(json.dumps(value))
+
+    def _make_json_type_error(self, value, json_value, json_type):
+        """
+        Make DeserializationError for a decoded value of wrong JSON type.
+
+        @param json_value: JSON Value the value was decoded from or None to encode it from value.
+        @param json_type: Expected JSON type, e.g. "JSON string".
+        """
+        if json_value is None:
+            json_value = json.dumps(value)
+
+        return DeserializationError("'{}' is not a {}".format(json_value, json_type), json_value, self.name)
 
     #{ Access backend
 
     def allow_cache(self, enclosing_self):
-        return self._allow_cache or \
-               (self._allow_cache is None and hasattr(enclosing_self, 'ALLOW_CACHE') and enclosing_self.ALLOW_CACHE)
+        if self._allow_cache is None:
+            return getattr(enclosing_self, 'ALLOW_CACHE', False)
+        else:
+            return self._allow_cache
+
+    def _make_python_value_from_json_value(self, enclosing_self, json_value, source):
+        try:
+            python_value = self.deserialize_json(json_value)
+            self.validate(python_value)
+            return python_value, source
+        except (DeserializationError, ValidationError) as e:
+            exc_info = (type(e), e, e.__traceback__)
+            return getattr(enclosing_self, self._resolver)(exc_info, self.name, json_value, source), ValueSource.resolver
+
+    def _make_python_value_from_raw_value(self, enclosing_self, raw_value, source):
+        try:
+            python_value = self.deserialize(raw_value)
+            self.validate(python_value)
+            return python_value, source
+        except (DeserializationError, ValidationError) as e:
+            exc_info = (type(e), e, e.__traceback__)
+            return getattr(enclosing_self, self._resolver)(exc_info, self.name, raw_value, source), ValueSource.resolver
 
     def read_value(self, enclosing_self):
         """
@@ -208,22 +321,6 @@ class BaseOption(property, metaclass=ABCMeta):
 
         @rtype: (object, ValueSource)
         """
-        def make_python_value_from_json_value(json_value, source):
-            try:
-                python_value = self.deserialize_json(json_value)
-                self.validate(python_value)
-                return python_value, source
-            except (DeserializationError, ValidationError):
-                return getattr(enclosing_self, self._resolver)(sys.exc_info(), self.name, json_value, source), ValueSource.resolver
-
-        def make_python_value_from_raw_value(raw_value, source):
-            try:
-                python_value = self.deserialize(raw_value)
-                self.validate(python_value)
-                return python_value, source
-            except (DeserializationError, ValidationError):
-                return getattr(enclosing_self, self._resolver)(sys.exc_info(), self.name, raw_value, source), ValueSource.resolver
-
         python_value, source = None, None
 
         if self._env_name:
@@ -233,7 +330,7 @@ class BaseOption(property, metaclass=ABCMeta):
                 python_value, source = self._default, ValueSource.env
             elif json_value is not None:
                 LOG.debug("Value of \"%s\" is overridden by environment variable: %s.", self.name, json_value)
-                python_value, source = make_python_value_from_json_value(json_value, ValueSource.env)
+                python_value, source = self._make_python_value_from_json_value(enclosing_self, json_value, ValueSource.env)
 
         if python_value is None and self._is_one_shot_value_set:
             LOG.debug("Value of \"%s\" is temporary overridden by one shot value: %s.", self.name, self._one_shot_value)
@@ -241,7 +338,7 @@ class BaseOption(property, metaclass=ABCMeta):
         elif python_value is None:
             raw_value = getattr(enclosing_self, self._getter)(self.name, allow_cache=self.allow_cache(enclosing_self))
             if raw_value is not None:
-                python_value, source = make_python_value_from_raw_value(raw_value, ValueSource.config)
+                python_value, source = self._make_python_value_from_raw_value(enclosing_self, raw_value, ValueSource.config)
 
         if python_value is None:
             LOG.debug("No value is set for \"%s\", use default.", self.name)
@@ -274,8 +371,7 @@ class BaseOption(property, metaclass=ABCMeta):
         self._is_one_shot_value_set = False
 
         if python_value is not None:
-            self.validate(python_value)
-            raw_value = self.serialize(python_value)
+            raw_value = self.validate_and_serialize(python_value)
             getattr(enclosing_self, self._setter)(self.name, raw_value, allow_cache=self.allow_cache(enclosing_self))
         else:
             self.fdel(enclosing_self)
@@ -302,6 +398,56 @@ class BaseContainerOption(BaseOption):
 
     Unlike BaseOption, raw values are represented by a container class (such as list or dict) where each value
     is a UTF-8 encoded string.
+
+    Subclasses must set _value_option before calling __init__ and implement _validate_container_type,
+    _validate_elements and _validate_and_serialize_elements.
     """
     def __init__(self, *args, **kwargs):
+        # Element methods are bound once to avoid looking them up through value_option on every call.
+        value_option = self._value_option
+        self._serialize_value = value_option.serialize
+        self._deserialize_value = value_option.deserialize
+        self._serialize_json_value = value_option.serialize_json
+        self._deserialize_json_value = value_option.deserialize_json_value
+        self._validate_value = value_option.validate
+        self._validate_and_serialize_value = value_option.validate_and_serialize
+
+        # Single pass is only equivalent to validate and serialize if a subclass of the container overrides neither.
+        cls = type(self)
+        container_cls = next(c for c in cls.__mro__ if '_validate_and_serialize_elements' in vars(c))
+        self._is_single_pass = cls.validate is container_cls.validate and cls.serialize is container_cls.serialize
+
         super().__init__(*args, **kwargs)
+
+    def validate(self, python_value):
+        super().validate(python_value)
+        self._validate_container_type(python_value)
+        self._validate_elements(python_value)
+
+    def validate_and_serialize(self, python_value):
+        if not self._is_single_pass:
+            return super().validate_and_serialize(python_value)
+
+        super().validate(python_value)
+        self._validate_container_type(python_value)
+        return self._validate_and_serialize_elements(python_value)
+
+    def _validate_container_type(self, python_value):
+        """
+        @raise ValidationError: Raise if python_value is not an instance of the container class.
+        """
+        raise NotImplementedError()
+
+    def _validate_elements(self, python_value):
+        """
+        Validate each element with value_option.
+        """
+        raise NotImplementedError()
+
+    def _validate_and_serialize_elements(self, python_value):
+        """
+        Validate and serialize each element with value_option in a single pass.
+
+        @return: Raw Value.
+        """
+        raise NotImplementedError()
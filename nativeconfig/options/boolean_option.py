@@ -20,6 +20,10 @@ class BooleanOption(BaseOption):
         """
         Accepts all the arguments of BaseConfig except choices.
         """
+        # Lookup is made per instance so subclasses can override the class variables.
+        self._raw_value_to_bool = dict.fromkeys(self.FALSE_RAW_VALUES, False)
+        self._raw_value_to_bool.update(dict.fromkeys(self.TRUE_RAW_VALUES, True))
+
         choices = kwargs.pop('choices', (True, False))
         super().__init__(name, choices=choices, **kwargs)
 
@@ -27,19 +31,21 @@ class BooleanOption(BaseOption):
         return '1' if python_value else '0'
 
     def deserialize(self, raw_value):
-        if raw_value.upper() in self.TRUE_RAW_VALUES:
-            return True
-        elif raw_value.upper() in self.FALSE_RAW_VALUES:
-            return False
+        # Raw values written by serialize are already canonical.
+        python_value = self._raw_value_to_bool.get(raw_value)
+
+        if python_value is None:
+            python_value = self._raw_value_to_bool.get(raw_value.upper())
+
+        if python_value is not None:
+            return python_value
         else:
             raise DeserializationError("'{}' must be in {}".format(raw_value, self.ALLOWED_RAW_VALUES), raw_value, self.name)
 
-    def deserialize_json(self, json_value):
-        value = super().deserialize_json(json_value)
-
+    def _deserialize_decoded_json(self, value, json_value):
         if value is not None:
             if not isinstance(value, bool):
-                raise DeserializationError("'{}' is not a JSON boolean".format(json_value), json_value, self.name)
+                raise self._make_json_type_error(value, json_value, "JSON boolean")
             else:
                 return bool(value)
         else:
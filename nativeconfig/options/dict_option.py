@@ -1,4 +1,5 @@
 import json
+from json.encoder import encode_basestring_ascii
 
 from .base_option import BaseOption, BaseContainerOption
 from nativeconfig.exceptions import DeserializationError, ValidationError
@@ -24,22 +25,17 @@ class DictOption(BaseContainerOption):
         super().__init__(name, getter='get_dict_value', setter='set_dict_value', **kwargs)
 
     def serialize(self, python_value):
-        serializable_dict = {}
-
-        for k, v in python_value.items():
-            serialized_v = self._value_option.serialize(v)
-            serializable_dict.update({k: serialized_v})
-
-        return serializable_dict
+        serialize = self._serialize_value
+        return {k: serialize(v) for k, v in python_value.items()}
 
     def deserialize(self, raw_value):
-        try:
-            deserialized_dict = {}
+        if not isinstance(raw_value, dict):
+            raise DeserializationError("'{}' is not a dict".format(raw_value), raw_value, self.name)
 
-            for k, v in raw_value.items():
-                deserialized_dict.update({k: self._value_option.deserialize(v)})
+        deserialize = self._deserialize_value
 
-            value = deserialized_dict
+        try:
+            value = {k: deserialize(v) for k, v in raw_value.items()}
         except DeserializationError:
             raise DeserializationError("unable to deserialize '{}' into dict".format(raw_value), raw_value, self.name)
         else:
@@ -49,7 +45,10 @@ class DictOption(BaseContainerOption):
         # A JSON dict of JSON-serialized values must be constructed manually
         # to avoid double-serialization.
         if python_value is not None:
-            return '{' + ', '.join(['{}: {}'.format(json.dumps(k), self._value_option.serialize_json(v)) for k, v in python_value.items()]) + '}'
+            # String keys are encoded the same way json.dumps does, but without its per-call overhead.
+            serialize_json = self._serialize_json_value
+            return '{' + ', '.join([(encode_basestring_ascii(k) if type(k) is str else json.dumps(k)) + ': ' + serialize_json(v)
+                                    for k, v in python_value.items()]) + '}'
         else:
             return super().serialize_json(python_value)
 
@@ -58,17 +57,24 @@ class DictOption(BaseContainerOption):
 
         if value is not None:
             if isinstance(value, dict):
-                return {k: self._value_option.deserialize_json(json.dumps(v)) for k, v in value.items()}
+                deserialize_json_value = self._deserialize_json_value
+                return {k: deserialize_json_value(v) for k, v in value.items()}
             else:
                 raise DeserializationError("'{}' is not a JSON dict".format(json_value), json_value, self.name)
         else:
             return None
 
-    def validate(self, python_value):
-        super().validate(python_value)
+    #{ BaseContainerOption
 
+    def _validate_container_type(self, python_value):
         if not isinstance(python_value, dict):
             raise ValidationError("'{}' must be a dict".format(python_value), python_value, self.name)
 
+    def _validate_elements(self, python_value):
+        validate = self._validate_value
         for v in python_value.values():
-            self._value_option.validate(v)
+            validate(v)
+
+    def _validate_and_serialize_elements(self, python_value):
+        validate_and_serialize = self._validate_and_serialize_value
+        return {k: validate_and_serialize(v) for k, v in python_value.items()}
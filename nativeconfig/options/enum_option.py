@@ -1,4 +1,5 @@
 import enum
+from functools import lru_cache
 import logging
 
 from .base_option import BaseOption, BaseContainerOption
@@ -33,6 +34,23 @@ class EnumOption(BaseOption):
         else:
             raise ValueError("'enum_type' must be a subclass of enum.Enum")
 
+        # Lookup of members by value. Unhashable values are left to the enum_type itself.
+        self._value_to_member = {}
+        for member in enum_type:
+            try:
+                self._value_to_member.setdefault(member.value, member)
+            except TypeError:
+                pass
+
+        # Case-insensitive lookup of members by str(member) and by name. Earlier members take precedence.
+        self._lower_to_member = {}
+        for member_name, member in enum_type.__members__.items():
+            self._lower_to_member.setdefault(str(member).lower(), member)
+            self._lower_to_member.setdefault(member_name.lower(), member)
+
+        # Members of raw values deserialized by value_option. Bounded since raw values may vary, e.g. '1', '01', '001'.
+        self._raw_value_to_member = lru_cache(maxsize=256)(self._find_member_by_value)
+
         if value_option:
             if isinstance(value_option, BaseOption) and not isinstance(value_option, BaseContainerOption):
                 self._value_option = value_option
@@ -61,23 +79,45 @@ class EnumOption(BaseOption):
         """
         1. If value_option is set, will try to instantiate enum by value
         2. Otherwise will try to find an appropriate value by comparing string.
+
+        Members are immutable, so members found by value are remembered.
         """
         if self._value_option:
-            try:
-                return self._enum_type(self._value_option.deserialize(raw_value))
-            except (ValueError, DeserializationError):
-                pass
+            member = self._raw_value_to_member(raw_value)
+
+            if member is not None:
+                return member
 
-        LOG.info("Unable to instantiate \"{}\" directly.", self._enum_type)
+        LOG.info("Unable to instantiate \"%s\" directly.", self._enum_type)
 
-        raw_value_lower = raw_value.lower()
+        value = self._lower_to_member.get(raw_value.lower())
 
-        for name, value in self._enum_type.__members__.items():
-            if str(value).lower() == raw_value_lower or name.lower() == raw_value_lower:
-                return value
+        if value is not None:
+            return value
 
         raise DeserializationError("unable to deserialize '{}' into {}".format(raw_value, self._enum_type), raw_value, self.name)
 
+    def _find_member_by_value(self, raw_value):
+        """
+        Find member by value deserialized with value_option.
+
+        @return: Member or None if raw_value doesn't represent a value of any member.
+        """
+        try:
+            value = self._value_option.deserialize(raw_value)
+        except DeserializationError:
+            return None
+
+        member = self._member_for_value(value)
+
+        if member is not None:
+            return member
+
+        try:
+            return self._enum_type(value)
+        except ValueError:
+            return None
+
     def serialize_json(self, python_value):
         if python_value is None:
             return super().serialize_json(python_value)
@@ -87,32 +127,55 @@ class EnumOption(BaseOption):
             return super().serialize_json(python_value.name)
 
     def deserialize_json(self, json_value):
-        if json_value == 'null':
+        return self.deserialize_json_value(super().deserialize_json(json_value))
+
+    def deserialize_json_value(self, value):
+        if value is None:
             return None
         elif self._value_option:
             try:
-                enum_value = self._value_option.deserialize_json(json_value)
+                enum_value = self._value_option.deserialize_json_value(value)
             except DeserializationError:
-                enum_value = super().deserialize_json(json_value)
+                enum_value = value
         else:
-            enum_value = super().deserialize_json(json_value)
+            enum_value = value
+
+        member = self._member_for_value(enum_value)
+
+        if member is not None:
+            return member
 
         try:
-            return self._enum_type(enum_value)
-        except ValueError:
-            pass
+            member = self._enum_type.__members__.get(enum_value)
+        except TypeError:
+            member = None
+
+        if member is not None:
+            return member
 
         try:
-            return self._enum_type[enum_value]
-        except KeyError:
+            return self._enum_type(enum_value)
+        except ValueError:
             pass
 
         raw_value = str(enum_value)
 
         return self.deserialize(raw_value)
 
+    def _member_for_value(self, value):
+        """
+        Find member by its value without going through enum_type's exception-raising lookup.
+
+        @return: Member or None if there is no member with such a hashable value.
+        """
+        try:
+            return self._value_to_member.get(value)
+        except TypeError:
+            return None
+
     def validate(self, python_value):
         super().validate(python_value)
 
-        if not isinstance(python_value, self._enum_type):
+        # Members are always instances of enum_type itself since enums with members cannot be subclassed.
+        if type(python_value) is not self._enum_type:
             raise ValidationError("'{}' must be in {}".format(python_value, self._enum_type), python_value, self.name)
@@ -22,14 +22,12 @@ class FloatOption(BaseOption):
         else:
             return value
 
-    def deserialize_json(self, json_value):
-        value = super().deserialize_json(json_value)
-
+    def _deserialize_decoded_json(self, value, json_value):
         if value is not None:
             if not isinstance(value, float):
-                raise DeserializationError("'{}' is not a JSON float".format(json_value), json_value, self.name)
+                raise self._make_json_type_error(value, json_value, "JSON float")
             else:
-                return float(value)
+                return value
         else:
             return None
 
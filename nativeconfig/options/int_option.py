@@ -18,14 +18,13 @@ class IntOption(BaseOption):
         except ValueError:
             raise DeserializationError("unable to deserialize '{}' into int".format(raw_value), raw_value, self.name)
 
-    def deserialize_json(self, json_value):
-        value = super().deserialize_json(json_value)
-
+    def _deserialize_decoded_json(self, value, json_value):
         if value is not None:
-            if not isinstance(value, int):
-                raise DeserializationError("'{}' is not a JSON integer".format(json_value), json_value, self.name)
+            # JSON true and false decode into bool which is a subclass of int.
+            if type(value) is not int:
+                raise self._make_json_type_error(value, json_value, "JSON integer")
             else:
-                return int(value)
+                return value
         else:
             return None
 
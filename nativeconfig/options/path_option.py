@@ -1,7 +1,18 @@
+from functools import lru_cache
+from json.decoder import scanstring
+from json.encoder import encode_basestring_ascii
 from pathlib import PurePath, Path
 
 from .base_option import BaseOption
-from nativeconfig.exceptions import ValidationError, DeserializationError
+from nativeconfig.exceptions import ValidationError
+
+
+@lru_cache(maxsize=256)
+def _make_path(path_type, value):
+    """
+    Make path_type instance from value. Paths are immutable, so instances are shared between reads.
+    """
+    return path_type(value)
 
 
 class PathOption(BaseOption):
@@ -25,19 +36,34 @@ class PathOption(BaseOption):
         super().__init__(name, **kwargs)
 
     def deserialize(self, raw_value):
-        return self._path_type(raw_value)
+        return _make_path(self._path_type, raw_value)
 
     def serialize_json(self, python_value):
-        return super().serialize_json(str(python_value) if python_value is not None else None)
+        # Encode the string the same way json.dumps does, but without its per-call overhead.
+        if python_value is not None:
+            return encode_basestring_ascii(str(python_value))
+        else:
+            return super().serialize_json(python_value)
 
     def deserialize_json(self, json_value):
-        value = super().deserialize_json(json_value)
+        # Bare JSON string is decoded directly. Anything else goes through the JSON parser.
+        if json_value[:1] == '"':
+            try:
+                value, end = scanstring(json_value, 1)
+            except ValueError:
+                pass
+            else:
+                if end == len(json_value):
+                    return _make_path(self._path_type, value)
+
+        return super().deserialize_json(json_value)
 
+    def _deserialize_decoded_json(self, value, json_value):
         if value is not None:
             if not isinstance(value, str):
-                raise DeserializationError("'{}' is not a JSON string".format(json_value), json_value, self.name)
+                raise self._make_json_type_error(value, json_value, "JSON string")
             else:
-                return self._path_type(value)
+                return _make_path(self._path_type, value)
         else:
             return None
 
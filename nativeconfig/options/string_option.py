@@ -1,5 +1,5 @@
 from .base_option import BaseOption
-from nativeconfig.exceptions import DeserializationError, ValidationError
+from nativeconfig.exceptions import ValidationError
 
 
 class StringOption(BaseOption):
@@ -16,12 +16,10 @@ class StringOption(BaseOption):
         self._allow_empty = allow_empty
         super().__init__(name, **kwargs)
 
-    def deserialize_json(self, json_value):
-        value = super().deserialize_json(json_value)
-
+    def _deserialize_decoded_json(self, value, json_value):
         if value is not None:
             if not isinstance(value, str):
-                raise DeserializationError("'{}' is not a JSON string".format(json_value), json_value, self.name)
+                raise self._make_json_type_error(value, json_value, "JSON string")
             else:
                 return str(value)
         else:
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 import json
 import os
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 from nativeconfig.options import StringOption, IntOption, ArrayOption, DictOption, ValueSource
 from nativeconfig.exceptions import DeserializationError, ValidationError
@@ -972,6 +974,122 @@ class ConfigMixin(ABC):
         c = MyConfig()
         self.assertIn('Age', c)
 
+    def test_values_set_in_batch_are_preserved(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName', default='Ilya')
+            age = IntOption('Age', default=42)
+
+        c = MyConfig.get_instance()
+
+        with c.batch():
+            c.first_name = 'Artem'
+
+            with c.batch():
+                c.age = 9000
+
+            del c.first_name
+            c.first_name = 'Konstantin'
+
+        self.assertEqual(c.get_value('FirstName'), 'Konstantin')
+        self.assertEqual(c.get_value('Age'), '9000')
+
+    def test_batch_writes_config_once(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName', default='Ilya')
+            age = IntOption('Age', default=42)
+
+        c = MyConfig.get_instance()
+
+        if c._read_backend() is None:
+            self.skipTest("backend doesn't support batching")
+
+        with patch.object(c, '_write_backend', wraps=c._write_backend) as write_backend:
+            with c.batch():
+                c.first_name = 'Artem'
+                c.age = 9000
+                self.assertEqual(c.first_name, 'Artem')
+                self.assertEqual(write_backend.call_count, 0)
+
+            self.assertEqual(write_backend.call_count, 1)
+
+        conf = c._read_backend()
+        self.assertEqual(conf['FirstName'], 'Artem')
+        self.assertEqual(conf['Age'], '9000')
+
+    def test_write_during_batch_flush_is_not_lost(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName')
+            last_name = StringOption('LastName')
+
+        c = MyConfig.get_instance()
+
+        if c._read_backend() is None:
+            self.skipTest("backend doesn't support batching")
+
+        write_backend = c._write_backend
+        flush_started = threading.Event()
+
+        def slow_write_backend(conf):
+            flush_started.set()
+            time.sleep(0.1)
+            write_backend(conf)
+
+        def set_last_name():
+            flush_started.wait()
+            c.last_name = 'Kulakov'
+
+        with patch.object(c, '_write_backend', side_effect=slow_write_backend):
+            t = threading.Thread(target=set_last_name)
+            t.start()
+
+            with c.batch():
+                c.first_name = 'Artem'
+
+            t.join()
+
+        conf = c._read_backend()
+        self.assertEqual(conf['FirstName'], 'Artem')
+        self.assertEqual(conf['LastName'], 'Kulakov')
+
+    def test_batch_can_be_used_within_config_context(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName', default='Ilya')
+
+        c = MyConfig.get_instance()
+
+        def set_first_name():
+            with c:
+                with c.batch():
+                    c.set_value_lock_free('FirstName', 'Artem')
+
+        t = threading.Thread(target=set_first_name, daemon=True)
+        t.start()
+        t.join(5)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(c.get_value('FirstName'), 'Artem')
+
+    def test_batch_from_another_thread_joins_open_batch(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName', default='Ilya')
+
+        c = MyConfig.get_instance()
+
+        if c._read_backend() is None:
+            self.skipTest("backend doesn't support batching")
+
+        def set_first_name():
+            with c.batch():
+                c.first_name = 'Artem'
+
+        with c.batch():
+            t = threading.Thread(target=set_first_name)
+            t.start()
+            t.join()
+
+            self.assertNotIn('FirstName', c._read_backend())
+
+        self.assertEqual(c._read_backend()['FirstName'], 'Artem')
+
     @abstractmethod
     def test_config_is_created_if_not_found(self):
         pass
@@ -1,12 +1,15 @@
 import collections
+import glob
 import json
 import os
+from pathlib import Path
+import stat
 import tempfile
 import unittest
 import unittest.mock
 
 from nativeconfig.configs.json_config import JSONConfig
-from nativeconfig.options import StringOption, IntOption, ArrayOption, DictOption
+from nativeconfig.options import StringOption, IntOption, ArrayOption, DictOption, PathOption
 
 from test.configs import ConfigMixin
 
@@ -80,3 +83,61 @@ class TestJSONConfig(ConfigMixin, unittest.TestCase):
         i = keys.index('SecondName')
         self.assertEqual(i + 1, keys.index('Age'))
         self.assertEqual(i + 2, keys.index('FirstName'))
+
+    def test_surrogate_escaped_path_round_trips(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName')
+            path = PathOption('Path')
+
+        c = MyConfig.get_instance()
+        path = Path('/tmp/caf\udce9')
+
+        c.path = path
+        c.first_name = 'Artem'
+
+        self.assertEqual(c.path, path)
+        self.assertEqual(c.first_name, 'Artem')
+
+    def test_write_replaces_config_atomically(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName', default='Ilya')
+
+        c = MyConfig.get_instance()
+
+        with unittest.mock.patch('os.fsync') as fsync:
+            c.first_name = 'Artem'
+            self.assertEqual(fsync.call_count, 1)
+
+        self.assertFalse(os.path.exists(MyConfig.JSON_PATH + '.tmp'))
+        self.assertEqual(glob.glob(MyConfig.JSON_PATH + '.*.tmp'), [])
+        self.assertEqual(c.first_name, 'Artem')
+
+    @unittest.skipIf(os.name == 'nt', "POSIX permissions and symlinks")
+    def test_write_preserves_permissions(self):
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName', default='Ilya')
+
+        c = MyConfig.get_instance()
+        os.chmod(MyConfig.JSON_PATH, 0o600)
+        c.first_name = 'Artem'
+
+        self.assertEqual(stat.S_IMODE(os.stat(MyConfig.JSON_PATH).st_mode), 0o600)
+
+    @unittest.skipIf(os.name == 'nt', "POSIX permissions and symlinks")
+    def test_write_follows_symlink(self):
+        target_path = tempfile.mktemp("_target_test.json")
+        self.addCleanup(lambda: os.path.exists(target_path) and os.unlink(target_path))
+
+        with open(target_path, 'w', encoding='utf-8') as f:
+            f.write('{}')
+
+        os.symlink(target_path, self.CONFIG_TYPE.JSON_PATH)
+
+        class MyConfig(self.CONFIG_TYPE):
+            first_name = StringOption('FirstName', default='Ilya')
+
+        c = MyConfig.get_instance()
+        c.first_name = 'Artem'
+
+        self.assertTrue(os.path.islink(MyConfig.JSON_PATH))
+        self.assertEqual(json.load(open(target_path, encoding='utf-8'))['FirstName'], 'Artem')
@@ -85,6 +85,15 @@ class TestYAMLConfig(YAMLConfigMixin, unittest.TestCase):
     CONFIG_TYPE = YAMLConfig
 
 
+class SafeYAMLConfig(_YAMLConfig):
+    YAML_LOADER = yaml.SafeLoader
+    YAML_DUMPER = yaml.Dumper
+
+
+class TestSafeYAMLConfig(YAMLConfigMixin, unittest.TestCase):
+    CONFIG_TYPE = SafeYAMLConfig
+
+
 try:
     class CYAMLConfig(YAMLConfig):
         YAML_LOADER = yaml.CLoader
@@ -95,3 +104,15 @@ try:
         CONFIG_TYPE = CYAMLConfig
 except AttributeError:
     pass
+
+
+try:
+    class CSafeYAMLConfig(_YAMLConfig):
+        YAML_LOADER = yaml.CSafeLoader
+        YAML_DUMPER = yaml.CDumper
+
+
+    class TestCSafeYAMLConfig(YAMLConfigMixin, unittest.TestCase):
+        CONFIG_TYPE = CSafeYAMLConfig
+except AttributeError:
+    pass
@@ -1,6 +1,7 @@
 from abc import ABC
 from collections import namedtuple
 from functools import partial
+import json
 import os
 from unittest.mock import patch
 
@@ -125,6 +126,13 @@ class OptionMixin(ABC):
             class MyConfig(StubConfig):
                 option = o.option_type('_', default=o.value, choices=[o.value])
 
+    def test_unhashable_value_is_not_in_choices(self):
+        for o in self.OPTIONS:
+            option = o.option_type('_', choices=[o.value])
+
+            with self.assertRaises(ValidationError):
+                option.validate([o.value])
+
     def test_choices_must_be_valid_if_set(self):
         for o in self.OPTIONS:
             with self.assertRaises(ValidationError):
@@ -146,6 +154,16 @@ class OptionMixin(ABC):
             python_value = MyConfig.option.deserialize(raw_value)
             self.assertEqual(python_value, o.value)
 
+    def test_validate_and_serialize_matches_serialize(self):
+        for o in self.OPTIONS:
+            class MyConfig(StubConfig):
+                option = o.option_type('_')
+
+            self.assertEqual(MyConfig.option.validate_and_serialize(o.value), MyConfig.option.serialize(o.value))
+
+            with self.assertRaises(ValidationError):
+                MyConfig.option.validate_and_serialize(o.invalid_value)
+
     def test_json_serialized_value_can_be_deserialized(self):
         for o in self.OPTIONS:
             class MyConfig(StubConfig):
@@ -155,6 +173,16 @@ class OptionMixin(ABC):
             python_value = MyConfig.option.deserialize_json(json_value)
             self.assertEqual(python_value, o.value)
 
+    def test_decoded_json_value_can_be_deserialized(self):
+        for o in self.OPTIONS:
+            class MyConfig(StubConfig):
+                option = o.option_type('_')
+
+            json_value = MyConfig.option.serialize_json(o.value)
+            python_value = MyConfig.option.deserialize_json_value(json.loads(json_value))
+            self.assertEqual(python_value, o.value)
+            self.assertEqual(MyConfig.option.deserialize_json_value(None), None)
+
     def test_serialize_json_to_None(self):
         for o in self.OPTIONS:
             class MyConfig(StubConfig):
@@ -1,7 +1,8 @@
 import unittest
 
-from nativeconfig import DeserializationError
+from nativeconfig import DeserializationError, ValidationError
 from nativeconfig import ArrayOption, FloatOption, IntOption, StringOption
+from nativeconfig.options.base_option import BaseOption
 
 from test.options import OptionMixin, Option, make_option_type
 
@@ -41,3 +42,39 @@ class TestArrayOption(OptionMixin, unittest.TestCase):
     def test_json_value_must_be_list(self):
         with self.assertRaises(DeserializationError):
             ArrayOption('_', value_option=FloatOption('_')).deserialize_json('42')
+
+    def test_raw_value_must_be_list(self):
+        with self.assertRaises(DeserializationError):
+            ArrayOption('_', value_option=StringOption('_')).deserialize('hello')
+
+        with self.assertRaises(DeserializationError):
+            ArrayOption('_', value_option=IntOption('_')).deserialize(42)
+
+    def test_default_property_returns_copy(self):
+        option = ArrayOption('_', value_option=IntOption('_'), default=[42])
+
+        default = option.default
+        default.append(9000)
+        self.assertEqual(option.default, [42])
+
+    def test_validate_and_serialize_respects_subclass_validate(self):
+        class ShortArrayOption(ArrayOption):
+            def validate(self, python_value):
+                super().validate(python_value)
+
+                if len(python_value) > 2:
+                    raise ValidationError("'{}' is too long".format(python_value), python_value, self.name)
+
+        option = ShortArrayOption('_', value_option=IntOption('_'))
+        self.assertEqual(option.validate_and_serialize([1, 2]), ['1', '2'])
+
+        with self.assertRaises(ValidationError):
+            option.validate_and_serialize([1, 2, 3])
+
+    def test_elements_are_deserialized_by_custom_deserialize_json(self):
+        class UpperOption(BaseOption):
+            def deserialize_json(self, json_value):
+                return super().deserialize_json(json_value).upper()
+
+        option = ArrayOption('_', value_option=UpperOption('_'))
+        self.assertEqual(option.deserialize_json('["a", "b"]'), ['A', 'B'])
@@ -1,5 +1,8 @@
+from collections import OrderedDict
+import json
 import unittest
 
+from nativeconfig import DeserializationError, ValidationError
 from nativeconfig import ArrayOption, DictOption, FloatOption, IntOption, StringOption
 
 from test.options import OptionMixin, Option, make_option_type
@@ -44,3 +47,28 @@ class TestDictOption(unittest.TestCase, OptionMixin):
     def test_value_option_cannot_be_container(self):
         with self.assertRaises(ValueError):
             DictOption('_', value_option=ArrayOption('_', value_option=StringOption('_')))
+
+    def test_raw_value_must_be_dict(self):
+        with self.assertRaises(DeserializationError):
+            DictOption('_', value_option=StringOption('_')).deserialize('hello')
+
+        with self.assertRaises(DeserializationError):
+            DictOption('_', value_option=IntOption('_')).deserialize(['42'])
+
+    def test_json_keys_are_escaped(self):
+        option = DictOption('_', value_option=IntOption('_'))
+        value = {'"quoted"': 1, 'ключ': 2, 'tab\t': 3}
+
+        self.assertEqual(option.serialize_json(value), json.dumps(value))
+        self.assertEqual(option.deserialize_json(option.serialize_json(value)), value)
+
+    def test_validate_and_serialize_respects_subclass_serialize(self):
+        class SortedDictOption(DictOption):
+            def serialize(self, python_value):
+                return OrderedDict(sorted(super().serialize(python_value).items()))
+
+        option = SortedDictOption('_', value_option=IntOption('_'))
+        self.assertEqual(list(option.validate_and_serialize({'b': 2, 'a': 1})), ['a', 'b'])
+
+        with self.assertRaises(ValidationError):
+            option.validate_and_serialize({'a': 'b'})
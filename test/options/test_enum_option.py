@@ -114,3 +114,38 @@ class TestEnumOption(OptionMixin, unittest.TestCase):
 
         os.environ[self.OPTION_ENV_NAME] = '"A"'
         self.assertEqual(c.enum_option, IntEnum.A)
+
+    def test_array_of_enums_can_be_deserialized_from_json(self):
+        self.assertEqual(ArrayOption('_', value_option=EnumOption('_', IntEnum)).deserialize_json('[1, "B"]'),
+                         [IntEnum.A, IntEnum.B])
+        self.assertEqual(ArrayOption('_', value_option=EnumOption('_', PathEnum)).deserialize_json('["A"]'),
+                         [PathEnum.A])
+
+    def test_raw_value_is_matched_case_insensitively(self):
+        option = EnumOption('_', PathEnum)
+
+        self.assertEqual(option.deserialize('b'), PathEnum.B)
+        self.assertEqual(option.deserialize(str(PathEnum.A).upper()), PathEnum.A)
+
+    def test_fallback_is_logged(self):
+        with self.assertLogs('nativeconfig', level='INFO') as cm:
+            self.assertEqual(EnumOption('_', IntEnum).deserialize('A'), IntEnum.A)
+
+        self.assertIn(str(IntEnum), cm.output[0])
+
+    def test_fallback_is_logged_for_every_deserialization(self):
+        option = EnumOption('_', IntEnum)
+
+        with self.assertLogs('nativeconfig', level='INFO') as cm:
+            self.assertEqual(option.deserialize('A'), IntEnum.A)
+            self.assertEqual(option.deserialize('A'), IntEnum.A)
+
+        self.assertEqual(len(cm.output), 2)
+
+    def test_remembered_raw_values_are_bounded(self):
+        option = EnumOption('_', IntEnum)
+
+        for i in range(1000):
+            self.assertEqual(option.deserialize('0' * i + str(IntEnum.A.value)), IntEnum.A)
+
+        self.assertLessEqual(option._raw_value_to_member.cache_info().currsize, 256)
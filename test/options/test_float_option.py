@@ -1,6 +1,6 @@
 import unittest
 
-from nativeconfig import FloatOption
+from nativeconfig import ArrayOption, DeserializationError, FloatOption
 
 from test.options import OptionMixin, Option
 
@@ -18,3 +18,15 @@ class TestFloatOption(unittest.TestCase, OptionMixin):
                 invalid_raw_value='world'
             )
         ]
+
+    def test_json_error_reports_json_value(self):
+        with self.assertRaises(DeserializationError) as cm:
+            FloatOption('_').deserialize_json(' "abc"')
+
+        self.assertEqual(cm.exception.raw_value, ' "abc"')
+        self.assertIn(' "abc"', str(cm.exception))
+
+        with self.assertRaises(DeserializationError) as cm:
+            ArrayOption('_', value_option=FloatOption('_')).deserialize_json('["abc"]')
+
+        self.assertEqual(cm.exception.raw_value, '"abc"')
@@ -1,5 +1,6 @@
 import unittest
 
+from nativeconfig.exceptions import DeserializationError, ValidationError
 from nativeconfig.options import IntOption
 
 from test.options import OptionMixin, Option
@@ -18,3 +19,17 @@ class TestIntOption(unittest.TestCase, OptionMixin):
                 invalid_raw_value='hello world'
             )
         ]
+
+    def test_json_boolean_is_not_integer(self):
+        with self.assertRaises(DeserializationError):
+            IntOption('_').deserialize_json('true')
+
+    def test_long_choices(self):
+        option = IntOption('_', choices=list(range(100)))
+        option.validate(99)
+
+        with self.assertRaises(ValidationError):
+            option.validate(100)
+
+        with self.assertRaises(ValidationError):
+            option.validate([99])
@@ -1,7 +1,8 @@
+import json
 from pathlib import Path, PurePosixPath
 import unittest
 
-from nativeconfig import PathOption
+from nativeconfig import DeserializationError, PathOption
 
 from test.options import OptionMixin, Option, make_option_type
 
@@ -31,3 +32,18 @@ class TestPathOption(unittest.TestCase, OptionMixin):
     def test_path_type_must_be_an_instance_of_PurePath(self):
         with self.assertRaises(ValueError):
             PathOption('_', path_type=str)
+
+    def test_json_value_is_decoded_like_json(self):
+        option = PathOption('_', path_type=PurePosixPath)
+
+        for p in ('/a b', '/"quoted"', '/а', '\\\\server\\share'):
+            self.assertEqual(option.serialize_json(PurePosixPath(p)), json.dumps(str(PurePosixPath(p))))
+            self.assertEqual(option.deserialize_json(option.serialize_json(PurePosixPath(p))), PurePosixPath(p))
+
+        self.assertEqual(option.deserialize_json(' "/a" '), PurePosixPath('/a'))
+
+        with self.assertRaises(DeserializationError):
+            option.deserialize_json('"/a" "/b"')
+
+        with self.assertRaises(DeserializationError):
+            option.deserialize_json('"/a')